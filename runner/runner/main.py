@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
+import functools
+import glob
+import hashlib
 import multiprocessing
 import os
+import pickle
 import shlex
 import subprocess
 import sys
@@ -8,25 +12,35 @@ import tempfile
 import time
 from pathlib import Path
 from subprocess import PIPE
-from typing import Any, BinaryIO, ContextManager, List, Mapping, Optional, cast
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import click
-import jsonschema
-import yaml
 from util import (
     cmake,
     fill_defaults,
     flatten1,
+    hash_file,
+    jobserver,
     make,
+    make_many,
     noop_context,
-    pathify,
+    open_fd,
+    parallel_map,
+    pathify_cached,
     relative_to,
-    replace_all,
     subprocess_run,
-    threading_map,
-    unflatten,
 )
-from yamlinclude import YamlIncludeConstructor
 
 # isort main.py
 # black -l 90 main.py
@@ -35,12 +49,13 @@ from yamlinclude import YamlIncludeConstructor
 root_dir = relative_to((Path(__file__).parent / "../..").resolve(), Path(".").resolve())
 
 cache_path = root_dir / ".cache" / "paths"
-cache_path.mkdir(parents=True, exist_ok=True)
+
+config_schema_path = root_dir / "runner/config_schema.yaml"
 
 
 def clean_one_plugin(config: Mapping[str, Any], plugin_config: Mapping[str, Any]) -> Path:
     profile = config["profile"]
-    path: Path = pathify(plugin_config["path"], root_dir, cache_path, True, True)
+    path: Path = pathify_cached(plugin_config["path"], root_dir, cache_path, True, True)
     path_str: str = str(path)
     name: str = plugin_config["name"] if plugin_config["name"] else os.path.basename(path_str)
     targets: List[str] = ["clean"]
@@ -50,25 +65,110 @@ def clean_one_plugin(config: Mapping[str, Any], plugin_config: Mapping[str, Any]
     return path
 
 
-def build_one_plugin(
+def prepare_one_plugin(
     config: Mapping[str, Any],
     plugin_config: Mapping[str, Any],
     test: bool = False,
-) -> Path:
+) -> Tuple[Path, List[str], Mapping[str, str]]:
+    """Fetches a plugin and links in common, returning its (path, targets, var_dict) for `make`."""
     profile = config["profile"]
-    path: Path = pathify(plugin_config["path"], root_dir, cache_path, True, True)
-    if not (path / "common").exists():
-        common_path = pathify(config["common"]["path"], root_dir, cache_path, True, True)
+    path: Path = pathify_cached(plugin_config["path"], root_dir, cache_path, True, True)
+    common_link = path / "common"
+    ## is_symlink() is a single lstat; exists() still catches a real 'common' dir
+    if not common_link.is_symlink() and not common_link.exists():
+        common_path = pathify_cached(config["common"]["path"], root_dir, cache_path, True, True)
         common_path = common_path.resolve()
-        os.symlink(common_path, path / "common")
+        try:
+            os.symlink(common_path, common_link, target_is_directory=True)
+        except FileExistsError:
+            ## Plugins are prepared in parallel; another worker may have linked it first
+            pass
     plugin_so_name = f"plugin.{profile}.so"
     targets = [plugin_so_name] + (["tests/run"] if test else [])
+    return path, targets, plugin_config["config"]
+
+
+def build_one_plugin(
+    config: Mapping[str, Any],
+    plugin_config: Mapping[str, Any],
+    test: bool = False,
+) -> Path:
+    path, targets, var_dict = prepare_one_plugin(config, plugin_config, test)
 
     ## When building using runner, enable ILLIXR integrated mode (compilation)
     env_override: Mapping[str, str] = dict(ILLIXR_INTEGRATION="yes")
-    make(path, targets, plugin_config["config"], env_override=env_override)
+    make(path, targets, var_dict, env_override=env_override)
+
+    return path / targets[0]
+
+
+T = TypeVar("T")
 
-    return path / plugin_so_name
+
+def plugin_key(plugin_config: Mapping[str, Any]) -> str:
+    """Identifies the directory a plugin is built in, from its (not yet fetched) path description.
+
+    Local paths are normalized, so 'timewarp_gl' and './timewarp_gl/' are the same plugin.
+    """
+    path_descr = plugin_config["path"]
+    if isinstance(path_descr, str):
+        return os.path.abspath(root_dir / path_descr)
+    return repr(path_descr)
+
+
+def map_plugins(
+    func: Callable[[Mapping[str, Any]], T],
+    config: Mapping[str, Any],
+    desc: Optional[str] = None,
+    describe: Callable[[T], Any] = str,
+) -> List[T]:
+    """Applies `func` in parallel processes to each distinct plugin of every plugin group.
+
+    Plugins are distinct by `plugin_key`, since two builds (or cleans) in the same
+    directory would race on the same outputs. A plugin listed more than once must have the
+    same build config each time. Results are returned in config order, one per plugin
+    listed. `desc` and `describe` are passed on to `parallel_map`.
+    """
+    plugin_configs = list(flatten1(plugin_group["plugin_group"] for plugin_group in config["plugin_groups"]))
+    unique_plugin_configs: Dict[str, Mapping[str, Any]] = {}
+    for plugin_config in plugin_configs:
+        unique_plugin_config = unique_plugin_configs.setdefault(plugin_key(plugin_config), plugin_config)
+        if unique_plugin_config["config"] != plugin_config["config"]:
+            raise ValueError(
+                f"Plugin {plugin_config['path']} is listed with conflicting configs "
+                f"{unique_plugin_config['config']} and {plugin_config['config']}"
+            )
+    results = dict(
+        zip(
+            unique_plugin_configs.keys(),
+            parallel_map(func, unique_plugin_configs.values(), desc=desc, describe=describe),
+        )
+    )
+    return [results[plugin_key(plugin_config)] for plugin_config in plugin_configs]
+
+
+def build_plugins(config: Mapping[str, Any]) -> List[Path]:
+    """Builds every plugin of every plugin group with a single `make -j` (see `make_many`)."""
+    builds = map_plugins(
+        functools.partial(prepare_one_plugin, config),
+        config,
+        desc="Fetching plugins",
+        describe=lambda build: build[0],
+    )
+
+    ## map_plugins already merged duplicate listings; this only catches distinct path
+    ## descriptions fetched into one directory (e.g. a git_repo and its cached checkout)
+    unique_builds: Dict[Path, Tuple[Path, List[str], Mapping[str, str]]] = {}
+    for build in builds:
+        path, _, var_dict = build
+        if unique_builds.setdefault(path, build)[2] != var_dict:
+            raise ValueError(f"Plugin {path} is listed with conflicting configs {unique_builds[path][2]} and {var_dict}")
+
+    ## When building using runner, enable ILLIXR integrated mode (compilation)
+    env_override: Mapping[str, str] = dict(ILLIXR_INTEGRATION="yes")
+    make_many(list(unique_builds.values()), env_override=env_override)
+
+    return [path / targets[0] for path, targets, _ in builds]
 
 
 def build_runtime(
@@ -81,7 +181,7 @@ def build_runtime(
     name = "main" if suffix == "exe" else "plugin"
     runtime_name = f"{name}.{profile}.{suffix}"
     runtime_config = config["runtime"]["config"]
-    runtime_path: Path = pathify(config["runtime"]["path"], root_dir, cache_path, True, True)
+    runtime_path: Path = pathify_cached(config["runtime"]["path"], root_dir, cache_path, True, True)
     targets = [runtime_name] + (["tests/run"] if test else [])
     env_override: Mapping[str, str] = dict(ILLIXR_INTEGRATION="ON")
     if is_mainline:
@@ -90,56 +190,53 @@ def build_runtime(
     return runtime_path / runtime_name
 
 
-def load_native(config: Mapping[str, Any]) -> None:
-    runtime_exe_path = build_runtime(config, "exe")
-    data_path = pathify(config["data"], root_dir, cache_path, True, True)
-    demo_data_path = pathify(config["demo_data"], root_dir, cache_path, True, True)
-    enable_offload_flag = config["enable_offload"]
-    enable_alignment_flag = config["enable_alignment"]
-    realsense_cam_string = config["realsense_cam"]
-    plugin_paths = threading_map(
-        lambda plugin_config: build_one_plugin(config, plugin_config),
-        [plugin_config for plugin_group in config["plugin_groups"] for plugin_config in plugin_group["plugin_group"]],
-        desc="Building plugins",
-    )
-    actual_cmd_str = config["action"].get("command", "$cmd")
-    illixr_cmd_list = [str(runtime_exe_path), *map(str, plugin_paths)]
-    env_override = dict(
+def runtime_env_override(config: Mapping[str, Any]) -> Dict[str, str]:
+    """Environment read by the ILLIXR runtime and plugins, shared by every action that runs them."""
+    data_path = pathify_cached(config["data"], root_dir, cache_path, True, True)
+    demo_data_path = pathify_cached(config["demo_data"], root_dir, cache_path, True, True)
+    return dict(
         ILLIXR_DATA=str(data_path),
         ILLIXR_DEMO_DATA=str(demo_data_path),
-        ILLIXR_OFFLOAD_ENABLE=str(enable_offload_flag),
-        ILLIXR_ALIGNMENT_ENABLE=str(enable_alignment_flag),
+        ILLIXR_OFFLOAD_ENABLE=str(config["enable_offload"]),
+        ILLIXR_ALIGNMENT_ENABLE=str(config["enable_alignment"]),
         ILLIXR_ENABLE_VERBOSE_ERRORS=str(config["enable_verbose_errors"]),
-        ILLIXR_RUN_DURATION=str(config["action"].get("ILLIXR_RUN_DURATION", 60)),
         ILLIXR_ENABLE_PRE_SLEEP=str(config["enable_pre_sleep"]),
         KIMERA_ROOT=config["action"]["kimera_path"],
         AUDIO_ROOT=config["action"]["audio_path"],
-        REALSENSE_CAM=str(realsense_cam_string),
+        REALSENSE_CAM=str(config["realsense_cam"]),
     )
+
+
+def load_native(config: Mapping[str, Any]) -> None:
+    runtime_exe_path = build_runtime(config, "exe")
+    env_override = runtime_env_override(config)
+    env_override["ILLIXR_RUN_DURATION"] = str(config["action"].get("ILLIXR_RUN_DURATION", 60))
+    plugin_paths = build_plugins(config)
+    actual_cmd_str = config["action"].get("command", "$cmd")
+    illixr_cmd_list = [str(runtime_exe_path), *map(str, plugin_paths)]
     env_list = [f"{shlex.quote(var)}={shlex.quote(val)}" for var, val in env_override.items()]
-    actual_cmd_list = list(
-        flatten1(
-            replace_all(
-                unflatten(shlex.split(actual_cmd_str)),
-                {
-                    ("$env_cmd",): [
-                        "env",
-                        "-C",
-                        Path(".").resolve(),
-                        *env_list,
-                        *illixr_cmd_list,
-                    ],
-                    ("$cmd",): illixr_cmd_list,
-                    ("$quoted_cmd",): [shlex.quote(shlex.join(illixr_cmd_list))],
-                    ("$env",): env_list,
-                },
-            )
-        )
-    )
+    cmd_substitutions: Mapping[str, List[str]] = {
+        "$env_cmd": [
+            "env",
+            "-C",
+            str(Path(".").resolve()),
+            *env_list,
+            *illixr_cmd_list,
+        ],
+        "$cmd": illixr_cmd_list,
+        "$quoted_cmd": [shlex.quote(shlex.join(illixr_cmd_list))],
+        "$env": env_list,
+    }
+    actual_cmd_list: List[str] = []
+    for token in shlex.split(actual_cmd_str):
+        substitution = cmd_substitutions.get(token)
+        if substitution is None:
+            actual_cmd_list.append(token)
+        else:
+            actual_cmd_list.extend(substitution)
     log_stdout_str = config["action"].get("log_stdout", None)
-    log_stdout_ctx = cast(
-        ContextManager[Optional[BinaryIO]],
-        (open(log_stdout_str, "wb") if (log_stdout_str is not None) else noop_context(None)),
+    log_stdout_ctx: ContextManager[Optional[int]] = (
+        open_fd(log_stdout_str) if (log_stdout_str is not None) else noop_context(None)
     )
     with log_stdout_ctx as log_stdout:
         subprocess_run(
@@ -152,16 +249,13 @@ def load_native(config: Mapping[str, Any]) -> None:
 
 def load_tests(config: Mapping[str, Any]) -> None:
     runtime_exe_path = build_runtime(config, "exe", test=True)
-    data_path = pathify(config["data"], root_dir, cache_path, True, True)
-    demo_data_path = pathify(config["demo_data"], root_dir, cache_path, True, True)
-    enable_offload_flag = config["enable_offload"]
-    enable_alignment_flag = config["enable_alignment"]
+    runtime_env = runtime_env_override(config)
+    runtime_env["ILLIXR_RUN_DURATION"] = str(config["action"].get("ILLIXR_RUN_DURATION", 10))
     env_override: Mapping[str, str] = dict(ILLIXR_INTEGRATION="yes")
     make(Path("common"), ["tests/run"], env_override=env_override)
-    realsense_cam_string = config["realsense_cam"]
-    plugin_paths = threading_map(
-        lambda plugin_config: build_one_plugin(config, plugin_config, test=True),
-        [plugin_config for plugin_group in config["plugin_groups"] for plugin_config in plugin_group["plugin_group"]],
+    plugin_paths = map_plugins(
+        functools.partial(build_one_plugin, config, test=True),
+        config,
         desc="Building plugins",
     )
 
@@ -173,54 +267,44 @@ def load_tests(config: Mapping[str, Any]) -> None:
 
     subprocess_run(
         cmd_list,
-        env_override=dict(
-            ILLIXR_DATA=str(data_path),
-            ILLIXR_DEMO_DATA=str(demo_data_path),
-            ILLIXR_RUN_DURATION=str(config["action"].get("ILLIXR_RUN_DURATION", 10)),
-            ILLIXR_OFFLOAD_ENABLE=str(enable_offload_flag),
-            ILLIXR_ALIGNMENT_ENABLE=str(enable_alignment_flag),
-            ILLIXR_ENABLE_VERBOSE_ERRORS=str(config["enable_verbose_errors"]),
-            ILLIXR_ENABLE_PRE_SLEEP=str(enable_pre_sleep),
-            KIMERA_ROOT=config["action"]["kimera_path"],
-            AUDIO_ROOT=config["action"]["audio_path"],
-            REALSENSE_CAM=str(realsense_cam_string),
-        ),
+        env_override=runtime_env,
         check=True,
     )
 
 
+def build_one_monado_plugin(
+    config: Mapping[str, Any],
+    is_mainline: bool,
+    plugin_config: Dict[str, Any],
+) -> Path:
+    if is_mainline:
+        plugin_config.update(ILLIXR_MONADO_MAINLINE="ON")
+    return build_one_plugin(config, plugin_config)
+
+
 def load_monado(config: Mapping[str, Any]) -> None:
     action_name = config["action"]["name"]
 
     profile = config["profile"]
     cmake_profile = "Debug" if profile == "dbg" else "RelWithDebInfo"
 
-    runtime_path = pathify(config["runtime"]["path"], root_dir, cache_path, True, True)
+    runtime_path = pathify_cached(config["runtime"]["path"], root_dir, cache_path, True, True)
     monado_config = config["action"]["monado"].get("config", {})
-    monado_path = pathify(config["action"]["monado"]["path"], root_dir, cache_path, True, True)
-    data_path = pathify(config["data"], root_dir, cache_path, True, True)
-    demo_data_path = pathify(config["demo_data"], root_dir, cache_path, True, True)
-    enable_offload_flag = config["enable_offload"]
-    enable_alignment_flag = config["enable_alignment"]
-    realsense_cam_string = config["realsense_cam"]
+    monado_path = pathify_cached(config["action"]["monado"]["path"], root_dir, cache_path, True, True)
+    runtime_env = runtime_env_override(config)
 
     is_mainline: bool = bool(config["action"]["is_mainline"])
     build_runtime(config, "so", is_mainline=is_mainline)
 
-    def process_plugin(plugin_config: Mapping[str, Any]) -> Path:
-        if is_mainline:
-            plugin_config.update(ILLIXR_MONADO_MAINLINE="ON")
-        return build_one_plugin(config, plugin_config)
-
-    plugin_paths: List[Path] = threading_map(
-        process_plugin,
-        [plugin_config for plugin_group in config["plugin_groups"] for plugin_config in plugin_group["plugin_group"]],
+    plugin_paths: List[Path] = map_plugins(
+        functools.partial(build_one_monado_plugin, config, is_mainline),
+        config,
         desc="Building plugins",
     )
     plugin_paths_comp_arg: str = ':'.join(map(str, plugin_paths))
 
     env_monado: Mapping[str, str] = dict(
-        ILLIXR_DATA=str(data_path),
+        ILLIXR_DATA=runtime_env["ILLIXR_DATA"],
         ILLIXR_PATH=str(runtime_path / f"plugin.{profile}.so"),
         ILLIXR_COMP=plugin_paths_comp_arg,
         XR_RUNTIME_JSON=str(monado_path / "build" / "openxr_monado-dev.json"),
@@ -255,12 +339,12 @@ def load_monado(config: Mapping[str, Any]) -> None:
 
     if "src_path" in openxr_app_obj["app"]:
         ## Pathify 'src_path' for compilation
-        openxr_app_path     = pathify(openxr_app_obj["app"]["src_path"], root_dir, cache_path, True , True)
+        openxr_app_path     = pathify_cached(openxr_app_obj["app"]["src_path"], root_dir, cache_path, True , True)
         openxr_app_bin_path = openxr_app_path / openxr_app_obj["app"]["bin_subpath"]
     else:
         ## Get the full path to the 'app' binary
         openxr_app_path     = None
-        openxr_app_bin_path = pathify(openxr_app_obj["app"], root_dir, cache_path, True, True)
+        openxr_app_bin_path = pathify_cached(openxr_app_obj["app"], root_dir, cache_path, True, True)
 
     ## Compile the OpenXR app if we received an 'app' with 'src_path'
     if openxr_app_path:
@@ -291,17 +375,7 @@ def load_monado(config: Mapping[str, Any]) -> None:
 
     subprocess_run(
         [str(openxr_app_bin_path)],
-        env_override=dict(
-            ILLIXR_DEMO_DATA=str(demo_data_path),
-            ILLIXR_OFFLOAD_ENABLE=str(enable_offload_flag),
-            ILLIXR_ALIGNMENT_ENABLE=str(enable_alignment_flag),
-            ILLIXR_ENABLE_VERBOSE_ERRORS=str(config["enable_verbose_errors"]),
-            ILLIXR_ENABLE_PRE_SLEEP=str(config["enable_pre_sleep"]),
-            KIMERA_ROOT=config["action"]["kimera_path"],
-            AUDIO_ROOT=config["action"]["audio_path"],
-            REALSENSE_CAM=str(realsense_cam_string),
-            **env_monado,
-        ),
+        env_override={**runtime_env, **env_monado},
         check=True,
     )
 
@@ -325,9 +399,9 @@ def load_monado(config: Mapping[str, Any]) -> None:
 
 
 def clean_project(config: Mapping[str, Any]) -> None:
-    plugin_paths = threading_map(
-        lambda plugin_config: clean_one_plugin(config, plugin_config),
-        [plugin_config for plugin_group in config["plugin_groups"] for plugin_config in plugin_group["plugin_group"]],
+    plugin_paths = map_plugins(
+        functools.partial(clean_one_plugin, config),
+        config,
         desc="Cleaning plugins",
     )
 
@@ -362,27 +436,129 @@ actions = {
 }
 
 
-def run_config(config_path: Path) -> None:
-    """Parse a YAML config file, returning the validated ILLIXR system config."""
-    YamlIncludeConstructor.add_to_loader_class(
-        loader_class=yaml.FullLoader,
+def yaml_safe_loader() -> Any:
+    """Returns libyaml's CSafeLoader, or the pure-Python SafeLoader if PyYAML lacks libyaml."""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+## The schema is static per checkout, so it is parsed and compiled at most once.
+## yaml and jsonschema are imported lazily, since loading a cached config needs neither.
+@functools.lru_cache(maxsize=None)
+def get_config_schema() -> Mapping[str, Any]:
+    import yaml
+
+    with config_schema_path.open() as f:
+        return cast(Mapping[str, Any], yaml.load(f, Loader=yaml_safe_loader()))
+
+
+@functools.lru_cache(maxsize=None)
+def get_config_validator() -> Any:
+    import jsonschema
+
+    return jsonschema.Draft7Validator(get_config_schema())
+
+
+def config_digest(config_path: Path, includes: List[Tuple[str, bool]]) -> str:
+    """Digests the runner, the config, the schema, and the files matched by each (pattern, recursive) include."""
+    digest = hashlib.blake2b()
+    ## The cached config also depends on the code producing it (the loader, fill_defaults,
+    ## the entry layout), so a changed runner invalidates every entry
+    digest.update(hash_file(Path(__file__)))
+    digest.update(hash_file(Path(__file__).parent / "util.py"))
+    digest.update(hash_file(config_path))
+    digest.update(hash_file(config_schema_path))
+    for pattern, recursive in includes:
+        digest.update(pattern.encode())
+        for include_path in sorted(glob.glob(pattern, recursive=recursive)):
+            if os.path.isfile(include_path):
+                digest.update(include_path.encode())
+                digest.update(hash_file(Path(include_path)))
+    return digest.hexdigest()
+
+
+def load_config(config_path: Path) -> Any:
+    """Parse and validate a YAML config file against the config schema, filling in defaults.
+
+    The resulting config is pickled into `cache_path`, one entry per config file, along with
+    the paths (or glob patterns) that its `!include`s read while parsing. The entry is reused
+    while a digest of the config, the schema, and the files those includes match is
+    unchanged, so unchanged configs skip parsing and validation. Only files read through
+    `!include` are tracked.
+    """
+    path_digest = hashlib.blake2b(str(config_path.resolve()).encode(), digest_size=16)
+    pickle_path = cache_path / f"config.{path_digest.hexdigest()}.pkl"
+
+    try:
+        with pickle_path.open("rb") as cache_file:
+            entry = pickle.load(cache_file)
+        if entry["digest"] == config_digest(config_path, entry["includes"]):
+            return entry["config"]
+    except Exception:
+        ## A missing, truncated, or otherwise unreadable cache entry is just a cache miss
+        pass
+
+    import yaml
+    from yamlinclude import YamlIncludeConstructor
+
+    base_dir = config_path.parent.resolve()
+    includes: List[Tuple[str, bool]] = []
+
+    class RecordingIncludeConstructor(YamlIncludeConstructor):  # type: ignore
+        """Records the (pattern, recursive) of each `!include`, resolved like pyyaml-include does."""
+
+        def load(self, loader: Any, pathname: str, recursive: bool = False, **kwargs: Any) -> Any:
+            includes.append((os.path.join(base_dir, pathname), recursive))
+            return super().load(loader, pathname, recursive=recursive, **kwargs)
+
+    safe_loader = yaml_safe_loader()
+    RecordingIncludeConstructor.add_to_loader_class(
+        loader_class=safe_loader,
         base_dir=config_path.parent,
     )
 
-    with config_path.open() as f:
-        config = yaml.full_load(f)
+    with config_path.open() as config_file:
+        config = yaml.load(config_file, Loader=safe_loader)
+
+    get_config_validator().validate(config)
+    fill_defaults(config, get_config_schema())
+
+    entry = dict(digest=config_digest(config_path, includes), includes=includes, config=config)
 
-    with (root_dir / "runner/config_schema.yaml").open() as f:
-        config_schema = yaml.safe_load(f)
+    ## Dump to a temporary file and rename it into place, so that an interrupted or racing
+    ## run never leaves a truncated pickle at `pickle_path`. Each config has a single entry,
+    ## so an edited config replaces its stale entry instead of adding another.
+    tmp_path: Optional[Path] = None
+    try:
+        with tempfile.NamedTemporaryFile("wb", dir=cache_path, suffix=".tmp", delete=False) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+            pickle.dump(entry, tmp_file)
+        os.replace(tmp_path, pickle_path)
+        tmp_path = None
+    except Exception as e:
+        ## Like reading it, writing the cache is best-effort
+        print(f"[Config] Not caching '{config_path}': {e}")
+    finally:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
 
-    jsonschema.validate(instance=config, schema=config_schema)
-    fill_defaults(config, config_schema)
+    return config
+
+
+def run_config(config_path: Path) -> None:
+    """Parse a YAML config file, returning the validated ILLIXR system config."""
+    cache_path.mkdir(parents=True, exist_ok=True)
+    config = load_config(config_path)
 
     action = config["action"]["name"]
 
     if action not in actions:
         raise RuntimeError(f"No such action: {action}")
-    actions[action](config)
+
+    ## All of the action's make invocations (plugins, runtime, CMake projects) share job slots
+    with jobserver():
+        actions[action](config)
 
 
 if __name__ == "__main__":
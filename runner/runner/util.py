@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
 from dataclasses import dataclass
+import hashlib
 import itertools
 import multiprocessing
 import operator
 import os
 import queue
+import re
+import select
 import shlex
+import stat
 import subprocess
 import sys
+import tempfile
 import threading
 import urllib.parse
 import urllib.request
@@ -24,6 +30,7 @@ from typing import (
     Awaitable,
     BinaryIO,
     Callable,
+    Dict,
     Iterable,
     Iterator,
     Generic,
@@ -145,7 +152,8 @@ def subprocess_run(
     env: Optional[Mapping[str, str]] = None,
     env_override: Optional[Mapping[str, str]] = None,
     capture_output: bool = False,
-    stdout: Optional[BinaryIO] = None,
+    stdout: Optional[Union[int, BinaryIO]] = None,
+    pass_fds: Sequence[int] = (),
 ) -> subprocess.CompletedProcess[bytes]:
     """Wrapper around of subprocess.run.
 
@@ -164,7 +172,9 @@ def subprocess_run(
     if env_override:
         env.update(env_override)
 
-    proc = subprocess.run(args, env=env, cwd=cwd, capture_output=capture_output, stdout=stdout)
+    proc = subprocess.run(
+        args, env=env, cwd=cwd, capture_output=capture_output, stdout=stdout, pass_fds=pass_fds
+    )
 
     if check:
         if proc.returncode != 0:
@@ -206,7 +216,8 @@ def threading_imap_unordered(
 ) -> Iterable[V]:
     """Clone of multiprocessing.imap_unordered for threads with tqdm for progress
 
-    `desc` is an optional label for the progress bar.
+    `desc` is an optional label for the progress bar. `describe` formats each result to
+    print as it completes; it runs in this process, so it may be a lambda.
 
     If the length cannot be determined by operator.length_hint, `length_hint` will be used. If it is None, we fallback to tqdm without a `total`.
     """
@@ -266,7 +277,8 @@ def threading_map(
 ) -> Iterable[V]:
     """Clone of multiprocessing.map for threads with tqdm for progress
 
-    `desc` is an optional label for the progress bar.
+    `desc` is an optional label for the progress bar. `describe` formats each result to
+    print as it completes; it runs in this process, so it may be a lambda.
 
     If the length cannot be determined by operator.length_hint, `length_hint` will be used. If it is None, we fallback to tqdm without a `total`.
     """
@@ -284,6 +296,44 @@ def threading_map(
     )
 
 
+def parallel_map(
+    func: Callable[[T], V],
+    iterable: Iterable[T],
+    max_workers: Optional[int] = None,
+    desc: Optional[str] = None,
+    describe: Callable[[V], Any] = str,
+) -> List[V]:
+    """Clone of multiprocessing.map over a process pool with tqdm for progress
+
+    Unlike `threading_map`, `func` runs outside of this interpreter's GIL, so it and the
+    elements of `iterable` must be picklable (use functools.partial, not a lambda).
+
+    `desc` is an optional label for the progress bar. `describe` formats each result to
+    print as it completes; it runs in this process, so it may be a lambda.
+    """
+
+    items = list(iterable)
+    if not items:
+        return []
+    ## Forked workers inherit module state and open fds (such as the `jobserver()` pipe),
+    ## which spawned or forkserver workers (the Linux default from Python 3.14) would not
+    with concurrent.futures.ProcessPoolExecutor(
+        ## With the fork context, every worker is forked on the first submit, so don't
+        ## start more than there are items
+        max_workers=min(len(items), max_workers or os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("fork"),
+    ) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        for future in tqdm(
+            concurrent.futures.as_completed(futures),
+            total=len(futures),
+            desc=desc,
+            unit="plugins",
+        ):
+            tqdm.write(str(describe(future.result())))
+        return [future.result() for future in futures]
+
+
 def fill_defaults(
     thing: Any, thing_schema: Mapping[str, Any], path: Optional[List[str]] = None
 ) -> None:
@@ -369,6 +419,23 @@ def unzip_with_progress(zip_path: Path, output_dir: Path, desc: Optional[str] =
         raise e
 
 
+HASH_BLOCKSIZE = 65536
+
+
+def hash_file(path: Path) -> bytes:
+    """Returns the BLAKE2b digest of the file at `path`, read in fixed-size blocks."""
+    h = hashlib.blake2b()
+    buf = bytearray(HASH_BLOCKSIZE)
+    view = memoryview(buf)
+    with path.open("rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.digest()
+
+
 # Only Python 3.9 has Path.is_relative_to :'(
 def is_relative_to(a: Path, b: Path) -> bool:
     try:
@@ -498,11 +565,154 @@ Returns:
         raise ValueError(f"Unsupported path description {path_descr}")
 
 
+_pathify_memo: Dict[Tuple[str, str, str, bool, bool], Path] = {}
+
+
+def pathify_cached(
+    path_descr: Union[str, Mapping[str, Any]],
+    base: Path,
+    cache_path: Path,
+    should_exist: bool,
+    should_dir: bool,
+) -> Path:
+    """Memoized version of `pathify`.
+
+    The same path description (e.g. a plugin listed in several plugin groups) is only
+    resolved (and fetched, for the git_repo scheme) once per process.
+    """
+    key = (str(path_descr), str(base), str(cache_path), should_exist, should_dir)
+    if key not in _pathify_memo:
+        _pathify_memo[key] = pathify(path_descr, base, cache_path, should_exist, should_dir)
+    return _pathify_memo[key]
+
+
 @contextlib.contextmanager
 def noop_context(x: Any) -> Iterator[Any]:
     yield x
 
 
+## (MAKEFLAGS, (read_fd, write_fd)) of the jobserver of the enclosing `jobserver()` context.
+## Only `make` children get it (see `make_jobserver_args`), rather than all of os.environ.
+_jobserver: Optional[Tuple[str, Tuple[int, int]]] = None
+
+
+def inherited_jobserver() -> Optional[Tuple[str, Tuple[int, int]]]:
+    """Returns the jobserver advertised in this process's MAKEFLAGS, if its pipe is open here.
+
+    MAKEFLAGS can outlive the fds it names (e.g. a shell exported it, or the runner was
+    started from a make recipe not marked `+`), so the fds are checked to be pipes.
+    """
+    makeflags = os.environ.get("MAKEFLAGS", "")
+    match = re.search(r"--jobserver-auth=(\d+),(\d+)", makeflags)
+    if not match:
+        return None
+    fds = (int(match.group(1)), int(match.group(2)))
+    for fd in fds:
+        try:
+            if not stat.S_ISFIFO(os.fstat(fd).st_mode):
+                return None
+        except OSError:
+            return None
+    return makeflags, fds
+
+
+@contextlib.contextmanager
+def jobserver(parallelism: Optional[int] = None) -> Iterator[None]:
+    """Shares `parallelism` job slots between every `make` launched within this context.
+
+    Creates a GNU make jobserver pipe, which `make` and `make_many` advertise to their
+    children through MAKEFLAGS, so that concurrent `make`s coordinate instead of each
+    starting its own `-j` pool. A live jobserver inherited from a parent make is reused.
+
+    Every make we start holds a token (see `jobserver_slot`) for its implicit job slot, so
+    at most `parallelism` jobs run however many `make`s run at once. Under an inherited
+    jobserver, the bound is the parent's `-j`, less the slot the runner itself occupies.
+    """
+
+    global _jobserver
+
+    if _jobserver is not None:
+        yield
+        return
+
+    inherited = inherited_jobserver()
+    if inherited is not None:
+        _jobserver = inherited
+        try:
+            yield
+        finally:
+            _jobserver = None
+        return
+
+    if parallelism is None:
+        parallelism = multiprocessing.cpu_count()
+
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"+" * parallelism)
+    _jobserver = (f"-j{parallelism} --jobserver-auth={read_fd},{write_fd}", (read_fd, write_fd))
+    try:
+        yield
+    finally:
+        _jobserver = None
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def make_jobserver_args(
+    parallelism: Optional[int],
+    default_parallelism: int,
+    env_override: Optional[Mapping[str, str]],
+) -> Tuple[List[str], Optional[Mapping[str, str]], Tuple[int, ...]]:
+    """Returns the (-j args, env_override, pass_fds) for running `make`.
+
+    An explicit `parallelism` gets its own `-j` pool. Otherwise, make joins the jobserver of
+    the enclosing `jobserver()` context, or falls back to `default_parallelism` jobs.
+    """
+    if parallelism is not None or _jobserver is None:
+        return ["-j", str(parallelism if parallelism is not None else default_parallelism)], env_override, ()
+    makeflags, fds = _jobserver
+    return [], {**(env_override or {}), "MAKEFLAGS": makeflags}, fds
+
+
+@contextlib.contextmanager
+def jobserver_slot(fds: Sequence[int]) -> Iterator[None]:
+    """Holds a token of the jobserver pipe `fds` (from `make_jobserver_args`), if any.
+
+    make runs its first job in an implicit slot that the pipe does not count, so each `make`
+    joining the jobserver must take a token for it, lest N concurrent `make`s run N extra jobs.
+    """
+    if not fds:
+        yield
+        return
+    read_fd, write_fd = fds
+    while True:
+        select.select([read_fd], [], [])
+        try:
+            token = os.read(read_fd, 1)
+            break
+        except BlockingIOError:
+            # make may set the shared pipe non-blocking; another process took the token
+            continue
+    try:
+        yield
+    finally:
+        os.write(write_fd, token)
+
+
+@contextlib.contextmanager
+def open_fd(path: Union[Path, str]) -> Iterator[int]:
+    """Opens `path` for writing (truncating it) as a raw, unbuffered fd.
+
+    Useful as the stdout of a subprocess, which writes to the fd directly; a Python file
+    object would only add a write buffer that the parent never uses.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        yield fd
+    finally:
+        os.close(fd)
+
+
 def make(
     path: Path,
     targets: List[str],
@@ -511,19 +721,60 @@ def make(
     env_override: Optional[Mapping[str, str]] = None
 ) -> None:
 
-    if parallelism is None:
-        parallelism = max(1, multiprocessing.cpu_count() // 2)
-
     var_dict_args: List[str] = list() if not var_dict else \
                                [f"{key}={val}" for key, val in var_dict.items()]
 
-    subprocess_run(
-        ["make", "-j", str(parallelism), "-C", str(path), *targets, *var_dict_args],
-        env_override=env_override,
-        check=True,
-        capture_output=True,
+    parallelism_args, env_override, pass_fds = make_jobserver_args(
+        parallelism, max(1, multiprocessing.cpu_count() // 2), env_override
     )
 
+    with jobserver_slot(pass_fds):
+        subprocess_run(
+            ["make", *parallelism_args, "-C", str(path), *targets, *var_dict_args],
+            env_override=env_override,
+            check=True,
+            capture_output=True,
+            pass_fds=pass_fds,
+        )
+
+
+def make_many(
+    builds: Sequence[Tuple[Path, List[str], Optional[Mapping[str, str]]]],
+    parallelism: Optional[int] = None,
+    env_override: Optional[Mapping[str, str]] = None
+) -> None:
+    """Runs `make` for each (path, targets, var_dict) in `builds` under one `make -j`.
+
+    The builds become recipes of a generated umbrella Makefile that recurse with `$(MAKE)`,
+    so they share the parent's jobserver (see `make_jobserver_args`) rather than each
+    starting a `-j` pool of their own.
+    """
+
+    build_names: List[str] = [f"build{i}" for i in range(len(builds))]
+
+    with tempfile.NamedTemporaryFile("w", suffix=".mk") as makefile:
+        makefile.write(f".PHONY: all {' '.join(build_names)}\n")
+        makefile.write(f"all: {' '.join(build_names)}\n")
+        for build_name, (path, targets, var_dict) in zip(build_names, builds):
+            var_dict_args: List[str] = list() if not var_dict else \
+                                       [f"{key}={val}" for key, val in var_dict.items()]
+            recipe = shlex.join(["-C", str(path), *targets, *var_dict_args])
+            makefile.write(f"{build_name}:\n\t$(MAKE) {recipe.replace('$', '$$')}\n")
+        makefile.flush()
+
+        parallelism_args, env_override, pass_fds = make_jobserver_args(
+            parallelism, multiprocessing.cpu_count(), env_override
+        )
+
+        with jobserver_slot(pass_fds):
+            subprocess_run(
+                ["make", *parallelism_args, "-f", makefile.name, "all"],
+                env_override=env_override,
+                check=True,
+                capture_output=True,
+                pass_fds=pass_fds,
+            )
+
 
 def cmake(
     path: Path,
@@ -533,9 +784,6 @@ def cmake(
     env_override: Optional[Mapping[str, str]] = None
 ) -> None:
 
-    if parallelism is None:
-        parallelism = max(1, multiprocessing.cpu_count() // 2)
-
     var_args = [f"-D{key}={val}" for key, val in (var_dict if var_dict else {}).items()]
     build_path.mkdir(exist_ok=True)
     subprocess_run(